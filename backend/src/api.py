@@ -1,3 +1,6 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException, status
 from .models import VisualizeRequest, GraphResult, ConfigFormat
 from .parser import parse_configs, ParseError
@@ -6,31 +9,71 @@ from .graph_builder import GraphBuilder
 
 router = APIRouter()
 
+# Recent extractions keyed by config digest, so expanding summary nodes
+# does not re-parse and re-extract large configs
+EXTRACTION_CACHE_SIZE = 16
+_extraction_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def _config_digest(request: VisualizeRequest) -> str:
+    h = hashlib.sha256(request.format.value.encode())
+    for cfg in request.configs:
+        data = cfg.encode()
+        # Length-prefix each config so boundaries are part of the digest
+        h.update(f"{len(data)}:".encode())
+        h.update(data)
+    return h.hexdigest()
+
+def _get_cached_extraction(extraction_id: str) -> Optional[Dict[str, Any]]:
+    extracted_data = _extraction_cache.get(extraction_id)
+    if extracted_data is not None:
+        _extraction_cache.move_to_end(extraction_id)
+    return extracted_data
+
+def _cache_extraction(extraction_id: str, extracted_data: Dict[str, Any]):
+    _extraction_cache[extraction_id] = extracted_data
+    _extraction_cache.move_to_end(extraction_id)
+    while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+        _extraction_cache.popitem(last=False)
+
 @router.post("/visualize", response_model=GraphResult)
 async def visualize(request: VisualizeRequest):
-    # 1. Parse
-    try:
-        parsed_config = parse_configs(request.configs, request.format)
-    except ParseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    if request.extraction_id is not None:
+        extraction_id = request.extraction_id
+        extracted_data = _get_cached_extraction(extraction_id)
+        if extracted_data is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Unknown extraction_id '{extraction_id}', resend configs"
+            )
+    else:
+        extraction_id = _config_digest(request)
+        extracted_data = _get_cached_extraction(extraction_id)
 
-    # 2. Extract
-    try:
-        extractor = Extractor(parsed_config)
-        extracted_data = extractor.extract()
-    except Exception as e:
-        # In a real app, we might want to log the stack trace
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Extraction failed: {str(e)}"
-        )
+    if extracted_data is None:
+        # 1. Parse
+        try:
+            parsed_config = parse_configs(request.configs, request.format)
+        except ParseError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # 2. Extract
+        try:
+            extractor = Extractor(parsed_config)
+            extracted_data = extractor.extract()
+        except Exception as e:
+            # In a real app, we might want to log the stack trace
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Extraction failed: {str(e)}"
+            )
+        _cache_extraction(extraction_id, extracted_data)
 
     # 3. Build Graph
     try:
-        builder = GraphBuilder(extracted_data)
+        builder = GraphBuilder(extracted_data, request.detail, request.expand)
         graph_result = builder.build()
     except Exception as e:
         raise HTTPException(
@@ -38,4 +81,5 @@ async def visualize(request: VisualizeRequest):
             detail=f"Graph construction failed: {str(e)}"
         )
 
+    graph_result.extraction_id = extraction_id
     return graph_result
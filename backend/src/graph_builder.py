@@ -1,13 +1,24 @@
-from typing import Dict, Any, List
-from .models import GraphResult, Node, Edge, NodeType, GraphStats
+from typing import Dict, Any, List, Optional, Set
+from .models import GraphResult, Node, Edge, NodeType, GraphStats, DetailLevel
+
+# How deep each detail level collapses the route hierarchy
+DETAIL_DEPTH = {
+    DetailLevel.FULL: 0,
+    DetailLevel.VIRTUAL_HOST: 1,
+    DetailLevel.ROUTE_CONFIG: 2,
+}
 
 class GraphBuilder:
-    def __init__(self, extracted_data: Dict[str, Any]):
+    def __init__(self, extracted_data: Dict[str, Any],
+                 detail: DetailLevel = DetailLevel.FULL,
+                 expand: Optional[List[str]] = None):
         self.data = extracted_data
+        self.detail = detail
+        self.expand = set(expand or [])
         self.nodes = []
         self.edges = []
         self.stats = GraphStats()
-        self.warnings = extracted_data.get("warnings", [])
+        self.warnings = list(extracted_data.get("warnings", []))
 
     def build(self) -> GraphResult:
         listeners = self.data.get("listeners", [])
@@ -35,6 +46,18 @@ class GraphBuilder:
                 self.edges.append(edge)
                 added_edge_ids.add(edge.id)
 
+        # Helper to merge repeated summary -> cluster edges into one with a count
+        counted_edges = {}
+        def add_counted_edge(source: str, target: str):
+            edge_id = f"{source}-{target}"
+            edge = counted_edges.get(edge_id)
+            if edge is None:
+                edge = Edge(id=edge_id, source=source, target=target, count=0)
+                counted_edges[edge_id] = edge
+                add_edge(edge)
+            edge.count += 1
+            edge.label = f"{edge.count} route{'s' if edge.count != 1 else ''}"
+
         # 1. Listeners
         for l in listeners:
             l_id = f"listener:{l['name']}"
@@ -91,68 +114,88 @@ class GraphBuilder:
                     ))
 
         # 2. RouteConfigs
-        for rc in route_configs:
+        # Same-named route configs (e.g. inlined by several listeners) share one
+        # node, so merge them before walking to keep counts and edges in step
+        for rc in self._merge_route_configs(route_configs):
             rc_id = f"route_config:{rc['name']}"
+            rc_collapsed = self._is_collapsed(rc_id, DetailLevel.ROUTE_CONFIG)
+            rc_data = {}
+            if rc_collapsed:
+                rc_routes = [r for vh in rc.get("virtual_hosts", []) for r in vh.get("routes", [])]
+                rc_data = self._summarize_routes(rc_routes, cluster_names)
+                rc_data["virtual_hosts"] = len(rc.get("virtual_hosts", []))
             add_node(Node(
                 id=rc_id,
                 type=NodeType.ROUTE_CONFIG,
-                label=rc["name"]
+                label=rc["name"],
+                data=rc_data
             ))
             self.stats.route_configs += 1
 
             # VirtualHosts
             for vh in rc.get("virtual_hosts", []):
                 vh_id = f"virtual_host:{rc['name']}:{vh['name']}"
-                add_node(Node(
-                    id=vh_id,
-                    type=NodeType.VIRTUAL_HOST,
-                    label=vh["name"],
-                    data={"domains": vh["domains"]}
-                ))
                 self.stats.virtual_hosts += 1
-                
-                # Edge RC -> VH
-                add_edge(Edge(
-                    id=f"{rc_id}-{vh_id}",
-                    source=rc_id,
-                    target=vh_id
-                ))
 
-                # Routes
-                for i, r in enumerate(vh.get("routes", [])):
-                    # Route ID needs to be unique
-                    r_label = self._get_route_label(r)
-                    r_id = f"route:{vh_id}:{i}"
+                if rc_collapsed:
+                    # Routes are attributed to the route config summary node
+                    vh_collapsed = True
+                    owner_id = rc_id
+                else:
+                    vh_collapsed = self._is_collapsed(vh_id, DetailLevel.VIRTUAL_HOST)
+                    vh_data = {"domains": vh["domains"]}
+                    if vh_collapsed:
+                        vh_data.update(self._summarize_routes(vh.get("routes", []), cluster_names))
                     add_node(Node(
-                        id=r_id,
-                        type=NodeType.ROUTE,
-                        label=r_label,
-                        data={"match": r["match"], "action": r["action"]}
+                        id=vh_id,
+                        type=NodeType.VIRTUAL_HOST,
+                        label=vh["name"],
+                        data=vh_data
                     ))
-                    self.stats.routes += 1
+                    owner_id = vh_id
 
-                    # Edge VH -> Route
+                    # Edge RC -> VH
                     add_edge(Edge(
-                        id=f"{vh_id}-{r_id}",
-                        source=vh_id,
-                        target=r_id
+                        id=f"{rc_id}-{vh_id}",
+                        source=rc_id,
+                        target=vh_id
                     ))
 
-                    # Edge Route -> Cluster
-                    target_clusters = []
-                    if r.get("cluster"):
-                        target_clusters.append(r["cluster"])
-                    for wc in r.get("weighted_clusters", []):
-                        target_clusters.append(wc["name"])
-                    
-                    for c_name in target_clusters:
+                # Routes
+                for i, r in enumerate(vh.get("routes", [])):
+                    self.stats.routes += 1
+                    source_id = owner_id
+                    if not vh_collapsed:
+                        # Route ID needs to be unique
+                        r_label = self._get_route_label(r)
+                        r_id = f"route:{vh_id}:{i}"
+                        add_node(Node(
+                            id=r_id,
+                            type=NodeType.ROUTE,
+                            label=r_label,
+                            data={"match": r["match"], "action": r["action"]}
+                        ))
+                        source_id = r_id
+
+                        # Edge VH -> Route
+                        add_edge(Edge(
+                            id=f"{vh_id}-{r_id}",
+                            source=vh_id,
+                            target=r_id
+                        ))
+
+                    # Edge Route -> Cluster (merged per summary node when collapsed)
+                    for c_name in self._get_route_clusters(r):
                         if c_name in cluster_names:
                             c_id = f"cluster:{c_name}"
-                            add_edge(Edge(
-                                id=f"{r_id}-{c_id}",
-                                source=r_id,
-                                target=c_id
-                            ))
+                            if vh_collapsed:
+                                add_counted_edge(source_id, c_id)
+                            else:
+                                add_edge(Edge(
+                                    id=f"{source_id}-{c_id}",
+                                    source=source_id,
+                                    target=c_id
+                                ))
                         else:
                             self.warnings.append(f"Route in VH '{vh['name']}' references missing Cluster '{c_name}'")
 
@@ -206,3 +249,48 @@ class GraphBuilder:
         elif "safe_regex" in match:
             return f"Regex: {match['safe_regex'].get('regex', '...')}"
         return "Route"
+
+    def _merge_route_configs(self, route_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Virtual hosts merge by name and routes by index, matching the node ids
+        # they render to; the first copy of a virtual host or route wins
+        merged: Dict[str, Dict[str, Any]] = {}
+        for rc in route_configs:
+            m_rc = merged.setdefault(rc["name"], {"name": rc["name"], "virtual_hosts": []})
+            m_vhs = {vh["name"]: vh for vh in m_rc["virtual_hosts"]}
+            for vh in rc.get("virtual_hosts", []):
+                m_vh = m_vhs.get(vh["name"])
+                if m_vh is None:
+                    m_vh = {**vh, "routes": list(vh.get("routes", []))}
+                    m_vhs[vh["name"]] = m_vh
+                    m_rc["virtual_hosts"].append(m_vh)
+                else:
+                    m_vh["routes"].extend(vh.get("routes", [])[len(m_vh["routes"]):])
+        return list(merged.values())
+
+    def _get_route_clusters(self, route: Dict[str, Any]) -> List[str]:
+        target_clusters = []
+        if route.get("cluster"):
+            target_clusters.append(route["cluster"])
+        for wc in route.get("weighted_clusters", []):
+            target_clusters.append(wc["name"])
+        # A cluster listed twice in weighted_clusters is still one reference
+        return list(dict.fromkeys(target_clusters))
+
+    def _is_collapsed(self, node_id: str, level: DetailLevel) -> bool:
+        # A node is summarized when the requested detail reaches its level,
+        # unless the caller asked to expand it
+        return DETAIL_DEPTH[self.detail] >= DETAIL_DEPTH[level] and node_id not in self.expand
+
+    def _summarize_routes(self, routes: List[Dict[str, Any]], cluster_names: Set[str]) -> Dict[str, Any]:
+        actions: Dict[str, int] = {}
+        clusters = set()
+        for r in routes:
+            actions[r["action"]] = actions.get(r["action"], 0) + 1
+            # Only resolved clusters, matching the edges drawn from the summary node
+            clusters.update(c for c in self._get_route_clusters(r) if c in cluster_names)
+        return {
+            "summary": True,
+            "routes": len(routes),
+            "actions": actions,
+            "clusters": len(clusters)
+        }
@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from enum import Enum
 
 class ConfigFormat(str, Enum):
@@ -7,9 +7,25 @@ class ConfigFormat(str, Enum):
     JSON = "json"
     YAML = "yaml"
 
+class DetailLevel(str, Enum):
+    FULL = "full"                  # one node per route
+    VIRTUAL_HOST = "virtual_host"  # routes collapsed into their virtual host
+    ROUTE_CONFIG = "route_config"  # virtual hosts collapsed into their route config
+
 class VisualizeRequest(BaseModel):
-    configs: List[str]
+    configs: Optional[List[str]] = None
+    # Handle from a previous GraphResult; reuses its extraction instead of configs
+    extraction_id: Optional[str] = None
     format: ConfigFormat = ConfigFormat.AUTO
+    detail: DetailLevel = DetailLevel.FULL
+    # Summary node ids to render one level deeper than `detail`
+    expand: List[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_config_source(self):
+        if (self.configs is None) == (self.extraction_id is None):
+            raise ValueError("Exactly one of configs or extraction_id is required")
+        return self
 
 class NodeType(str, Enum):
     LISTENER = "listener"
@@ -31,6 +47,8 @@ class Edge(BaseModel):
     source: str
     target: str
     label: Optional[str] = None
+    # Number of merged route -> cluster references on summary edges
+    count: Optional[int] = None
 
 class GraphStats(BaseModel):
     listeners: int = 0
@@ -45,3 +63,4 @@ class GraphResult(BaseModel):
     edges: List[Edge]
     stats: GraphStats
     warnings: List[str] = Field(default_factory=list)
+    extraction_id: Optional[str] = None
@@ -1,9 +1,17 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
+from src import api
 from src.main import app
 
 client = TestClient(app)
 
+@pytest.fixture(autouse=True)
+def clear_extraction_cache():
+    api._extraction_cache.clear()
+    yield
+    api._extraction_cache.clear()
+
 def test_healthz():
     response = client.get("/healthz")
     assert response.status_code == 200
@@ -45,3 +53,210 @@ def test_visualize_simple_listener():
     data = response.json()
     assert len(data["nodes"]) == 1
     assert data["nodes"][0]["id"] == "listener:test_listener"
+
+ROUTE_HEAVY_CONFIG = """
+{
+    "static_resources": {
+        "listeners": [
+            {
+                "name": "gateway",
+                "address": {"socket_address": {"address": "0.0.0.0", "port_value": 8080}},
+                "filter_chains": [{"filters": [{
+                    "name": "envoy.filters.network.http_connection_manager",
+                    "typed_config": {
+                        "@type": "type.googleapis.com/envoy.extensions.filters.network.http_connection_manager.v3.HttpConnectionManager",
+                        "route_config": {
+                            "name": "gateway_routes",
+                            "virtual_hosts": [
+                                {"name": "api", "domains": ["api.example.com"], "routes": [
+                                    {"match": {"prefix": "/a"}, "route": {"cluster": "backend"}},
+                                    {"match": {"prefix": "/b"}, "route": {"cluster": "backend"}},
+                                    {"match": {"prefix": "/c"}, "redirect": {"path_redirect": "/"}}
+                                ]},
+                                {"name": "web", "domains": ["www.example.com"], "routes": [
+                                    {"match": {"prefix": "/"}, "route": {"cluster": "backend"}}
+                                ]}
+                            ]
+                        }
+                    }
+                }]}]
+            }
+        ],
+        "clusters": [{"name": "backend", "type": "STRICT_DNS"}]
+    }
+}
+"""
+
+def test_visualize_detail_virtual_host():
+    response = client.post("/visualize", json={"configs": [ROUTE_HEAVY_CONFIG], "detail": "virtual_host"})
+    assert response.status_code == 200
+    data = response.json()
+    assert not [n for n in data["nodes"] if n["type"] == "route"]
+    assert data["stats"]["routes"] == 4
+
+    nodes = {n["id"]: n for n in data["nodes"]}
+    api_vh = nodes["virtual_host:gateway_routes:api"]
+    assert api_vh["data"]["summary"] is True
+    assert api_vh["data"]["routes"] == 3
+    assert api_vh["data"]["actions"] == {"route": 2, "redirect": 1}
+
+    edges = {e["id"]: e for e in data["edges"]}
+    assert edges["virtual_host:gateway_routes:api-cluster:backend"]["count"] == 2
+
+def test_visualize_detail_route_config_with_expand():
+    response = client.post("/visualize", json={"configs": [ROUTE_HEAVY_CONFIG], "detail": "route_config"})
+    assert response.status_code == 200
+    data = response.json()
+    assert not [n for n in data["nodes"] if n["type"] in ("virtual_host", "route")]
+    edges = {e["id"]: e for e in data["edges"]}
+    assert edges["route_config:gateway_routes-cluster:backend"]["count"] == 3
+
+    response = client.post("/visualize", json={
+        "configs": [ROUTE_HEAVY_CONFIG],
+        "detail": "route_config",
+        "expand": ["route_config:gateway_routes", "virtual_host:gateway_routes:web"]
+    })
+    assert response.status_code == 200
+    data = response.json()
+    node_ids = {n["id"] for n in data["nodes"]}
+    assert "virtual_host:gateway_routes:api" in node_ids
+    assert "route:virtual_host:gateway_routes:web:0" in node_ids
+    assert "route:virtual_host:gateway_routes:api:0" not in node_ids
+
+    edges = {e["id"]: e for e in data["edges"]}
+    assert "route_config:gateway_routes-cluster:backend" not in edges
+    assert edges["virtual_host:gateway_routes:api-cluster:backend"]["count"] == 2
+
+def _gateway_listener(name, route_config):
+    return {
+        "name": name,
+        "address": {"socket_address": {"address": "0.0.0.0", "port_value": 8080}},
+        "filter_chains": [{"filters": [{
+            "name": "envoy.filters.network.http_connection_manager",
+            "typed_config": {
+                "@type": "type.googleapis.com/envoy.extensions.filters.network.http_connection_manager.v3.HttpConnectionManager",
+                "route_config": route_config
+            }
+        }]}]
+    }
+
+def test_visualize_detail_shared_inline_route_config():
+    route_config = {
+        "name": "shared_routes",
+        "virtual_hosts": [{"name": "v", "domains": ["*"], "routes": [
+            {"match": {"prefix": "/"}, "route": {"weighted_clusters": {"clusters": [
+                {"name": "a", "weight": 50},
+                {"name": "a", "weight": 30},
+                {"name": "missing", "weight": 20}
+            ]}}}
+        ]}]
+    }
+    config = json.dumps({
+        "static_resources": {
+            "listeners": [
+                _gateway_listener("first", dict(route_config)),
+                _gateway_listener("second", dict(route_config))
+            ],
+            "clusters": [{"name": "a", "type": "STATIC"}]
+        }
+    })
+
+    for detail, summary_id in (("virtual_host", "virtual_host:shared_routes:v"),
+                               ("route_config", "route_config:shared_routes")):
+        response = client.post("/visualize", json={"configs": [config], "detail": detail})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stats"]["routes"] == 1
+
+        summary = next(n for n in data["nodes"] if n["id"] == summary_id)
+        assert summary["data"]["routes"] == 1
+        assert summary["data"]["clusters"] == 1
+
+        edge = next(e for e in data["edges"] if e["id"] == f"{summary_id}-cluster:a")
+        assert edge["count"] == 1
+        assert edge["label"] == "1 route"
+
+def test_visualize_expand_reuses_extraction(monkeypatch):
+    response = client.post("/visualize", json={"configs": [ROUTE_HEAVY_CONFIG], "detail": "route_config"})
+    assert response.status_code == 200
+    extraction_id = response.json()["extraction_id"]
+    assert extraction_id
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("configs were re-parsed")
+    monkeypatch.setattr("src.api.parse_configs", fail_parse)
+
+    response = client.post("/visualize", json={
+        "extraction_id": extraction_id,
+        "detail": "route_config",
+        "expand": ["route_config:gateway_routes"]
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["extraction_id"] == extraction_id
+    assert "virtual_host:gateway_routes:api" in {n["id"] for n in data["nodes"]}
+
+def test_visualize_unknown_extraction_id():
+    response = client.post("/visualize", json={"extraction_id": "missing", "detail": "route_config"})
+    assert response.status_code == 404
+    assert "Unknown extraction_id" in response.json()["detail"]
+
+def test_visualize_same_named_route_configs_merge_virtual_hosts():
+    def route_config(vh_name, cluster):
+        return {"name": "r", "virtual_hosts": [{"name": vh_name, "domains": ["*"], "routes": [
+            {"match": {"prefix": "/"}, "route": {"cluster": cluster}}
+        ]}]}
+    config = json.dumps({
+        "static_resources": {
+            "listeners": [
+                _gateway_listener("first", route_config("a", "c1")),
+                _gateway_listener("second", route_config("b", "c1"))
+            ],
+            "clusters": [{"name": "c1", "type": "STATIC"}]
+        }
+    })
+
+    response = client.post("/visualize", json={"configs": [config]})
+    assert response.status_code == 200
+    data = response.json()
+    node_ids = {n["id"] for n in data["nodes"]}
+    assert {"virtual_host:r:a", "virtual_host:r:b",
+            "route:virtual_host:r:a:0", "route:virtual_host:r:b:0"} <= node_ids
+    assert data["stats"]["virtual_hosts"] == 2
+    assert data["stats"]["routes"] == 2
+
+    response = client.post("/visualize", json={"configs": [config], "detail": "route_config"})
+    assert response.status_code == 200
+    data = response.json()
+    summary = next(n for n in data["nodes"] if n["id"] == "route_config:r")
+    assert summary["data"]["virtual_hosts"] == 2
+    assert summary["data"]["routes"] == 2
+    edges = {e["id"]: e for e in data["edges"]}
+    assert edges["route_config:r-cluster:c1"]["count"] == 2
+    assert data["stats"]["routes"] == 2
+
+def test_visualize_rejects_configs_with_extraction_id():
+    response = client.post("/visualize", json={"configs": [ROUTE_HEAVY_CONFIG]})
+    extraction_id = response.json()["extraction_id"]
+
+    response = client.post("/visualize", json={"configs": [ROUTE_HEAVY_CONFIG], "extraction_id": extraction_id})
+    assert response.status_code == 422
+
+    response = client.post("/visualize", json={"format": "json"})
+    assert response.status_code == 422
+
+def test_visualize_extraction_cache_eviction(monkeypatch):
+    monkeypatch.setattr(api, "EXTRACTION_CACHE_SIZE", 2)
+    extraction_ids = []
+    for i in range(3):
+        config = json.dumps({"static_resources": {"clusters": [{"name": f"c{i}", "type": "STATIC"}]}})
+        response = client.post("/visualize", json={"configs": [config]})
+        assert response.status_code == 200
+        extraction_ids.append(response.json()["extraction_id"])
+
+    response = client.post("/visualize", json={"extraction_id": extraction_ids[0]})
+    assert response.status_code == 404
+
+    response = client.post("/visualize", json={"extraction_id": extraction_ids[2]})
+    assert response.status_code == 200
+    assert [n["id"] for n in response.json()["nodes"]] == ["cluster:c2"]
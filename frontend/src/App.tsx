@@ -1,4 +1,5 @@
 import { useState } from 'react';
+import { isAxiosError } from 'axios';
 import { ConfigPanel } from './components/ConfigPanel';
 import { GraphPanel } from './components/GraphPanel';
 import { api } from './api/client';
@@ -44,6 +45,7 @@ function App() {
   const [graphData, setGraphData] = useState<GraphResult | null>(null);
   const [error, setError] = useState<string | undefined>();
   const [selectedNode, setSelectedNode] = useState<Node | null>(null);
+  const [lastRequest, setLastRequest] = useState<VisualizeRequest | null>(null);
 
   const handleVisualize = async (request: VisualizeRequest) => {
     setIsLoading(true);
@@ -54,6 +56,7 @@ function App() {
     try {
       const result = await api.visualize(request);
       setGraphData(result);
+      setLastRequest(request);
     } catch (err: any) {
       console.error(err);
       const msg = err.response?.data?.detail || err.message || 'Unknown error';
@@ -63,6 +66,45 @@ function App() {
     }
   };
 
+  const handleExpand = async (node: Node) => {
+    if (!lastRequest || !graphData) return;
+    const expandRequest: VisualizeRequest = {
+      format: lastRequest.format,
+      detail: lastRequest.detail,
+      expand: [...(lastRequest.expand || []), node.id],
+    };
+
+    setIsLoading(true);
+    setError(undefined);
+    setSelectedNode(null);
+
+    try {
+      const resend = () => api.visualize({ ...expandRequest, configs: lastRequest.configs });
+      let result: GraphResult;
+      if (graphData.extraction_id) {
+        try {
+          // Rebuild from the server's cached extraction
+          result = await api.visualize({ ...expandRequest, extraction_id: graphData.extraction_id });
+        } catch (err) {
+          if (!isAxiosError(err) || err.response?.status !== 404) throw err;
+          // Extraction was evicted; resend the configs
+          result = await resend();
+        }
+      } else {
+        result = await resend();
+      }
+      setGraphData(result);
+      setLastRequest({ ...expandRequest, configs: lastRequest.configs });
+    } catch (err) {
+      console.error(err);
+      const detail = isAxiosError<{ detail?: string }>(err) ? err.response?.data?.detail : undefined;
+      const msg = detail || (err instanceof Error ? err.message : 'Unknown error');
+      setError(msg);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   return (
     <ErrorBoundary>
       <div className="h-screen w-screen flex overflow-hidden bg-gray-950 text-white font-sans">
@@ -115,6 +157,16 @@ function App() {
                   <code className="text-xs bg-gray-950 p-1 rounded block break-all">{selectedNode.id}</code>
                 </div>
 
+                {selectedNode.data.summary && (
+                  <button
+                    onClick={() => handleExpand(selectedNode)}
+                    disabled={isLoading}
+                    className="w-full text-sm bg-blue-600 hover:bg-blue-500 disabled:opacity-50 rounded px-3 py-1.5"
+                  >
+                    Expand
+                  </button>
+                )}
+
                 {Object.entries(selectedNode.data).length > 0 && (
                   <div>
                     <h4 className="text-xs font-semibold text-gray-400 uppercase mb-1">Data</h4>
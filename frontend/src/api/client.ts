@@ -8,7 +8,10 @@ export const api = {
         // Ensure we send configs array
         const payload = {
             configs: request.configs,
-            format: request.format
+            format: request.format,
+            detail: request.detail,
+            expand: request.expand,
+            extraction_id: request.extraction_id
         };
         const response = await axios.post<GraphResult>(`${API_URL}/visualize`, payload);
         return response.data;
@@ -1,5 +1,5 @@
 import React, { useState, useRef } from 'react';
-import type { VisualizeRequest, GraphStats } from '../types';
+import type { VisualizeRequest, GraphStats, DetailLevel } from '../types';
 import { AlertCircle, Play, Upload, X, FileText, Settings } from 'lucide-react';
 
 interface ConfigPanelProps {
@@ -24,6 +24,7 @@ export const ConfigPanel: React.FC<ConfigPanelProps> = ({
 }) => {
     const [files, setFiles] = useState<ConfigFile[]>([]);
     const [format, setFormat] = useState<'auto' | 'json' | 'yaml'>('auto');
+    const [detail, setDetail] = useState<DetailLevel>('full');
     const fileInputRef = useRef<HTMLInputElement>(null);
 
     const handleFileUpload = async (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -52,7 +53,7 @@ export const ConfigPanel: React.FC<ConfigPanelProps> = ({
 
         if (configs.length === 0) return;
 
-        onVisualize({ configs, format });
+        onVisualize({ configs, format, detail });
     };
 
     const hasContent = files.length > 0;
@@ -73,15 +74,26 @@ export const ConfigPanel: React.FC<ConfigPanelProps> = ({
                 <div className="space-y-3">
                     <div className="flex justify-between items-center">
                         <label className="text-sm font-medium text-gray-400 uppercase tracking-wider">Configuration Files</label>
-                        <select
-                            value={format}
-                            onChange={(e) => setFormat(e.target.value as any)}
-                            className="bg-gray-900 border border-gray-700 rounded px-2 py-1 text-xs text-gray-400 focus:outline-none focus:border-blue-500 transition-colors"
-                        >
-                            <option value="auto">Auto Detect</option>
-                            <option value="json">JSON</option>
-                            <option value="yaml">YAML</option>
-                        </select>
+                        <div className="flex gap-2">
+                            <select
+                                value={format}
+                                onChange={(e) => setFormat(e.target.value as any)}
+                                className="bg-gray-900 border border-gray-700 rounded px-2 py-1 text-xs text-gray-400 focus:outline-none focus:border-blue-500 transition-colors"
+                            >
+                                <option value="auto">Auto Detect</option>
+                                <option value="json">JSON</option>
+                                <option value="yaml">YAML</option>
+                            </select>
+                            <select
+                                value={detail}
+                                onChange={(e) => setDetail(e.target.value as DetailLevel)}
+                                className="bg-gray-900 border border-gray-700 rounded px-2 py-1 text-xs text-gray-400 focus:outline-none focus:border-blue-500 transition-colors"
+                            >
+                                <option value="full">All Routes</option>
+                                <option value="virtual_host">Group by Virtual Host</option>
+                                <option value="route_config">Group by Route Config</option>
+                            </select>
+                        </div>
                     </div>
 
                     <div
@@ -92,6 +92,7 @@ export const GraphPanel: React.FC<GraphPanelProps> = ({ nodes, edges, onNodeClic
             id: e.id,
             source: e.source,
             target: e.target,
+            label: e.label,
             type: ConnectionLineType.Bezier,
             markerEnd: { type: MarkerType.ArrowClosed },
             style: { stroke: '#64748b', strokeWidth: 2 },
@@ -10,6 +10,7 @@ export interface Edge {
     source: string;
     target: string;
     label?: string;
+    count?: number;
 }
 
 export interface GraphStats {
@@ -26,9 +27,15 @@ export interface GraphResult {
     edges: Edge[];
     stats: GraphStats;
     warnings: string[];
+    extraction_id?: string;
 }
 
+export type DetailLevel = 'full' | 'virtual_host' | 'route_config';
+
 export interface VisualizeRequest {
-    configs: string[];
+    configs?: string[];
     format: 'auto' | 'json' | 'yaml';
+    detail?: DetailLevel;
+    expand?: string[];
+    extraction_id?: string;
 }